@@ -35,8 +35,12 @@ import threading
 import queue
 import time
 import signal
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+# Windows-specific flags
+_IS_WINDOWS = sys.platform.startswith('win')
+
 # Add project root to path
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, PROJECT_ROOT)
@@ -44,7 +48,7 @@ sys.path.insert(0, PROJECT_ROOT)
 from config import (
     CLASSIFICATION_DEFAULT_DURATION, CLASSIFICATION_DEFAULT_MODEL,
     CLASSIFICATION_QUEUE_MAXSIZE, CLASSIFICATION_STATUS_UPDATE_INTERVAL,
-    CLASSIFICATION_BATCH_FOLDERS,
+    CLASSIFICATION_BATCH_FOLDERS, N_JOBS,
     COLOR_CYAN, COLOR_CYAN_BOLD, COLOR_RED, COLOR_YELLOW, COLOR_GREEN, COLOR_RESET,
     COLOR_DARK_GRAY, COLOR_RED_BOLD
 )
@@ -80,28 +84,45 @@ def _discover_batch_files():
             os.makedirs(folder_path, exist_ok=True)
             continue
 
-        for fname in sorted(os.listdir(folder_path)):
-            if fname.lower().endswith(".csv"):
-                fpath = os.path.join(folder_path, fname)
-                if os.path.isfile(fpath):
-                    all_files.append({
-                        "name": fname,
-                        "path": fpath,
-                        "size": os.path.getsize(fpath),
-                        "folder_label": folder["label"],
-                        "model": folder["model"],
-                        "has_label": folder["has_label"],
-                        "use_all_classes": folder["use_all_classes"],
-                    })
+        # One scandir pass yields name, type and size (no per-file stat calls)
+        with os.scandir(folder_path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for entry in entries:
+            if entry.name.lower().endswith(".csv") and entry.is_file():
+                all_files.append({
+                    "name": entry.name,
+                    "path": entry.path,
+                    "size": entry.stat().st_size,
+                    "folder_label": folder["label"],
+                    "model": folder["model"],
+                    "has_label": folder["has_label"],
+                    "use_all_classes": folder["use_all_classes"],
+                })
 
     return all_files
 
 
 def _row_count(path):
-    """Count data rows in a CSV (subtract header)."""
+    """Count data rows in a CSV (subtract header).
+
+    Matches text-mode universal newlines: LF, CRLF and bare CR each end a line.
+    """
     try:
-        with open(path, "r") as f:
-            return sum(1 for _ in f) - 1
+        lines = 0
+        last = b"\n"
+        # Count line endings in raw blocks — no decoding, no per-line objects
+        with open(path, "rb") as f:
+            while True:
+                block = f.read(1024 * 1024)
+                if not block:
+                    break
+                lines += block.count(b"\n") + block.count(b"\r") - block.count(b"\r\n")
+                if last == b"\r" and block[:1] == b"\n":
+                    lines -= 1  # CRLF split across two blocks was counted twice
+                last = block[-1:]
+        if last not in (b"\n", b"\r"):
+            lines += 1  # final line without a trailing newline
+        return lines - 1
     except Exception:
         return -1
 
@@ -126,36 +147,48 @@ def select_batch_file():
             print(f"  {folder['path']}")
         return None, None, None
 
-    # Group into 4 clear sections
-    default_unlabeled = [f for f in all_files if not f["use_all_classes"] and not f["has_label"]]
-    default_labeled   = [f for f in all_files if not f["use_all_classes"] and f["has_label"]]
-    all_unlabeled     = [f for f in all_files if f["use_all_classes"] and not f["has_label"]]
-    all_labeled       = [f for f in all_files if f["use_all_classes"] and f["has_label"]]
+    # Group into 4 clear sections in one pass, keyed by (use_all_classes, has_label)
+    groups = {(False, False): [], (False, True): [], (True, False): [], (True, True): []}
+    for f in all_files:
+        groups[(f["use_all_classes"], f["has_label"])].append(f)
 
     print(f"\n{COLOR_CYAN}Available Batch Files:{COLOR_RESET}\n")
 
+    # Row counting reads every file end-to-end — probe files concurrently so the
+    # menu doesn't wait for the sum of all reads. Workers are capped the same way
+    # as ml_model/data_loader.py so many large CSVs don't thrash a spinning disk.
+    max_workers = min(6, N_JOBS) if N_JOBS > 0 else 6
+    with ThreadPoolExecutor(max_workers=min(len(all_files), max_workers)) as executor:
+        row_counts = dict(zip(
+            (bf["path"] for bf in all_files),
+            executor.map(_row_count, (bf["path"] for bf in all_files)),
+        ))
+
     idx = 1
     sections = [
-        ("Default — Unlabeled",  "data/data_model_use/default/batch/",         default_unlabeled),
-        ("Default — Labeled",    "data/data_model_use/default/batch_labeled/", default_labeled),
-        ("All — Unlabeled",      "data/data_model_use/all/batch/",             all_unlabeled),
-        ("All — Labeled",        "data/data_model_use/all/batch_labeled/",     all_labeled),
+        ("Default — Unlabeled",  "data/data_model_use/default/batch/",         groups[(False, False)]),
+        ("Default — Labeled",    "data/data_model_use/default/batch_labeled/", groups[(False, True)]),
+        ("All — Unlabeled",      "data/data_model_use/all/batch/",             groups[(True, False)]),
+        ("All — Labeled",        "data/data_model_use/all/batch_labeled/",     groups[(True, True)]),
     ]
 
+    # Build the whole menu first and emit it with a single write
+    menu_lines = []
     for section_label, folder_hint, file_list in sections:
         if not file_list:
             continue
         if idx > 1:
-            print()
-        print(f"  {COLOR_CYAN_BOLD}{section_label}{COLOR_RESET}  {COLOR_DARK_GRAY}({folder_hint}){COLOR_RESET}")
+            menu_lines.append("")
+        menu_lines.append(f"  {COLOR_CYAN_BOLD}{section_label}{COLOR_RESET}  {COLOR_DARK_GRAY}({folder_hint}){COLOR_RESET}")
         for bf in file_list:
             size_mb = bf["size"] / (1024 * 1024)
-            rows = _row_count(bf["path"])
+            rows = row_counts[bf["path"]]
             bf["_idx"] = idx
-            print(f"    [{idx}] {bf['name']}  ({size_mb:.2f} MB, {rows:,} rows)")
+            menu_lines.append(f"    [{idx}] {bf['name']}  ({size_mb:.2f} MB, {rows:,} rows)")
             idx += 1
 
-    print(f"\n{COLOR_CYAN}{'='*80}{COLOR_RESET}")
+    menu_lines.append(f"\n{COLOR_CYAN}{'='*80}{COLOR_RESET}")
+    print("\n".join(menu_lines))
 
     while True:
         try:
@@ -292,7 +325,7 @@ class ClassificationSession:
                     print(f"{COLOR_CYAN}[SESSION] Auto-selected Ethernet interface: {self.interface_name}{COLOR_RESET}")
                 else:
                     # No interfaces detected — check if we're on Linux without sudo
-                    if not sys.platform.startswith('win'):
+                    if not _IS_WINDOWS:
                         try:
                             if os.geteuid() != 0:
                                 print(f"{COLOR_RED}[SESSION] No network interfaces detected.{COLOR_RESET}")
@@ -300,8 +333,7 @@ class ClassificationSession:
                                 print(f"{COLOR_YELLOW}\nRun with sudo:{COLOR_RESET}")
                                 print(f"{COLOR_CYAN}      sudo ./venv/bin/python classification.py{COLOR_RESET}")
                                 print(f"{COLOR_YELLOW}\nOr grant Python capabilities (one-time):{COLOR_RESET}")
-                                import subprocess
-                                python_path = subprocess.check_output(["readlink", "-f", sys.executable]).decode().strip()
+                                python_path = os.path.realpath(sys.executable)
                                 print(f"{COLOR_CYAN}      sudo setcap cap_net_raw,cap_net_admin=eip {python_path}{COLOR_RESET}\n")
                                 return False
                         except Exception:
@@ -323,15 +355,14 @@ class ClassificationSession:
         """Start the live capture pipeline."""
 
         # Check for elevated privileges upfront on Linux/macOS (required for Scapy packet capture)
-        if not sys.platform.startswith('win'):
+        if not _IS_WINDOWS:
             try:
                 if os.geteuid() != 0:
                     print(f"{COLOR_RED}[ERROR] Cannot capture packets without elevated privileges on Linux/macOS.{COLOR_RESET}")
                     print(f"{COLOR_YELLOW}\n  Option 1: Run with sudo + full Python path:{COLOR_RESET}")
                     print(f"{COLOR_CYAN}      sudo ./venv/bin/python classification.py{COLOR_RESET}")
                     print(f"{COLOR_YELLOW}\n  Option 2: Grant Python capabilities (one-time setup, no sudo needed later):{COLOR_RESET}")
-                    import subprocess
-                    python_path = subprocess.check_output(["readlink", "-f", sys.executable]).decode().strip()
+                    python_path = os.path.realpath(sys.executable)
                     print(f"{COLOR_CYAN}      sudo setcap cap_net_raw,cap_net_admin=eip {python_path}{COLOR_RESET}\n")
                     return False
             except Exception:
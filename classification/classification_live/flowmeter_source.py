@@ -10,6 +10,7 @@ Requirements:
 """
 
 import os
+import re
 import sys
 import threading
 import queue
@@ -385,55 +386,73 @@ def _start_periodic_gc(session, interval):
 # Interface listing using Scapy
 # ============================================================
 
+# 'ip -o link show' lines: "2: eth0: <...>" or "5: veth1@if4: <...>"
+_IP_LINK_NAME_RE = re.compile(r'^\d+:\s*([^:@\s]+)', re.MULTILINE)
+# ifconfig header lines start at column 0: "en0: flags=..." or "eth0  Link encap:..."
+_IFCONFIG_NAME_RE = re.compile(r'^([^\s:]+)[^\n]*:', re.MULTILINE)
+
 def list_interfaces():
     """
     List available network interfaces.
-    First tries system commands (no root needed), then falls back to Scapy.
+    First tries socket.if_nameindex() and then system commands (no root
+    needed), then falls back to Scapy.
     Returns list of dicts with keys: index, name, description, addresses.
     """
     interfaces = []
 
-    # Try system commands first (works without root on Linux/macOS)
+    # Try the kernel interface table first (no subprocess, no root needed)
+    if not _IS_WINDOWS:
+        try:
+            import socket
+            for _, iface_name in socket.if_nameindex():
+                if iface_name.lower() not in ('lo', 'loopback'):
+                    interfaces.append({
+                        "index": len(interfaces),
+                        "name": iface_name,
+                        "description": "N/A",
+                        "addresses": "N/A",
+                    })
+            if interfaces:
+                return interfaces
+        except (AttributeError, OSError):
+            pass  # Fall through to system commands
+
+    # Try system commands next (works without root on Linux/macOS)
     if not _IS_WINDOWS:
         try:
+            import shutil
             import subprocess
             
-            # Try 'ip link show' (Linux)
-            if subprocess.run(['which', 'ip'], capture_output=True).returncode == 0:
-                result = subprocess.run(['ip', 'link', 'show'], capture_output=True, text=True, timeout=5)
+            # Try 'ip -o link show' (Linux) — one line per interface
+            if shutil.which('ip'):
+                result = subprocess.run(['ip', '-o', 'link', 'show'], stdin=subprocess.DEVNULL,
+                                        capture_output=True, text=True, timeout=5)
                 if result.returncode == 0:
-                    for line in result.stdout.split('\n'):
-                        if line and line[0].isdigit() and ':' in line:
-                            parts = line.split(':')
-                            if len(parts) >= 2:
-                                iface_name = parts[1].strip()
-                                # Skip loopback
-                                if iface_name.lower() not in ('lo', 'loopback'):
-                                    interfaces.append({
-                                        "index": len(interfaces),
-                                        "name": iface_name,
-                                        "description": "N/A",
-                                        "addresses": "N/A",
-                                    })
+                    for iface_name in _IP_LINK_NAME_RE.findall(result.stdout):
+                        # Skip loopback
+                        if iface_name.lower() not in ('lo', 'loopback'):
+                            interfaces.append({
+                                "index": len(interfaces),
+                                "name": iface_name,
+                                "description": "N/A",
+                                "addresses": "N/A",
+                            })
                     if interfaces:
                         return interfaces
             
             # Try 'ifconfig' (macOS/Linux fallback)
-            if subprocess.run(['which', 'ifconfig'], capture_output=True).returncode == 0:
-                result = subprocess.run(['ifconfig'], capture_output=True, text=True, timeout=5)
+            if shutil.which('ifconfig'):
+                result = subprocess.run(['ifconfig'], stdin=subprocess.DEVNULL,
+                                        capture_output=True, text=True, timeout=5)
                 if result.returncode == 0:
-                    import re
-                    for line in result.stdout.split('\n'):
-                        # ifconfig lines start with interface name (not whitespace)
-                        if line and line[0] not in (' ', '\t', '') and ':' in line:
-                            iface_name = line.split(':')[0].strip()
-                            if iface_name.lower() not in ('lo', 'loopback'):
-                                interfaces.append({
-                                    "index": len(interfaces),
-                                    "name": iface_name,
-                                    "description": "N/A",
-                                    "addresses": "N/A",
-                                })
+                    for iface_name in _IFCONFIG_NAME_RE.findall(result.stdout):
+                        if iface_name.lower() not in ('lo', 'loopback'):
+                            interfaces.append({
+                                "index": len(interfaces),
+                                "name": iface_name,
+                                "description": "N/A",
+                                "addresses": "N/A",
+                            })
                     if interfaces:
                         return interfaces
         except Exception:
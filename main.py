@@ -14,6 +14,7 @@ Usage
 import argparse
 import os
 import signal
+import socket
 import subprocess
 import sys
 import threading
@@ -96,8 +97,8 @@ def run_production(port: int, open_browser: bool):
 
     if open_browser:
         threading.Thread(
-            target=_open_browser_after_delay,
-            args=(f"http://localhost:{port}", 2),
+            target=_open_browser_when_ready,
+            args=(f"http://localhost:{port}", port),
             daemon=True,
         ).start()
 
@@ -109,6 +110,7 @@ def run_production(port: int, open_browser: bool):
 # ---------------------------------------------------------------------------
 
 _procs = []
+_STOP_GRACE_SECONDS = 1  # shared budget for all children to exit before SIGKILL
 
 def _stop_all(signum=None, frame=None):
     print("\n[NIDS] Shutting down...")
@@ -120,10 +122,17 @@ def _stop_all(signum=None, frame=None):
                 p.terminate()
         except Exception:
             pass
-    time.sleep(1)
+    # Block on each child's exit instead of sleeping a fixed interval:
+    # returns as soon as all have exited, kills only those still running.
+    deadline = time.monotonic() + _STOP_GRACE_SECONDS
     for p in _procs:
         try:
-            p.kill()
+            p.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            try:
+                p.kill()
+            except Exception:
+                pass
         except Exception:
             pass
     print("[NIDS] Stopped.")
@@ -154,8 +163,8 @@ def run_dev(port: int, open_browser: bool):
 
     if open_browser:
         threading.Thread(
-            target=_open_browser_after_delay,
-            args=("http://localhost:3000", 5),
+            target=_open_browser_when_ready,
+            args=("http://localhost:3000", 3000, frontend),
             daemon=True,
         ).start()
 
@@ -174,8 +183,34 @@ def run_dev(port: int, open_browser: bool):
 # Browser helper
 # ---------------------------------------------------------------------------
 
-def _open_browser_after_delay(url: str, delay: float):
-    time.sleep(delay)
+_BROWSER_READY_TIMEOUT = 60    # seconds to wait for the server port before opening anyway
+_BROWSER_POLL_INITIAL  = 0.05  # first delay between TCP connect probes (doubles each miss)
+_BROWSER_POLL_MAX      = 1.0   # cap on the delay between probes
+_BROWSER_CONNECT_TIMEOUT = 0.5  # per-probe connect timeout (a closed localhost port refuses at once)
+
+
+def _port_accepting(port: int) -> bool:
+    """Return True if something is accepting TCP connections on localhost:port."""
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=_BROWSER_CONNECT_TIMEOUT):
+            return True
+    except OSError:
+        return False
+
+
+def _open_browser_when_ready(url: str, port: int, proc=None):
+    # Probe the port instead of sleeping a fixed delay: the browser opens as
+    # soon as the server is up, and never before it is. If the process that
+    # should serve the port exits first, give up without opening.
+    # Back off exponentially so a fast server is caught within ~50 ms while
+    # a slow one (first dev compile) is not probed in a tight loop.
+    deadline = time.monotonic() + _BROWSER_READY_TIMEOUT
+    delay = _BROWSER_POLL_INITIAL
+    while not _port_accepting(port) and time.monotonic() < deadline:
+        if proc is not None and proc.poll() is not None:
+            return
+        time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+        delay = min(delay * 2, _BROWSER_POLL_MAX)
     print(f"[NIDS] Opening browser → {url}")
     webbrowser.open(url)
 
@@ -160,12 +160,12 @@ async def list_simulation_datasets():
     datasets = []
 
     if os.path.exists(simul_dir):
-        for name in os.listdir(simul_dir):
-            if name.endswith(".csv"):
-                fp = os.path.join(simul_dir, name)
-                datasets.append({
-                    "name": name,
-                    "size_mb": round(os.path.getsize(fp) / 1024 / 1024, 2),
-                })
+        with os.scandir(simul_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".csv"):
+                    datasets.append({
+                        "name": entry.name,
+                        "size_mb": round(entry.stat().st_size / 1024 / 1024, 2),
+                    })
 
     return {"datasets": datasets}
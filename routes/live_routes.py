@@ -322,6 +322,7 @@ async def live_start(body: LiveStartRequest) -> Dict[str, Any]:
     try:
         proc = subprocess.Popen(
             cmd,
+            stdin=subprocess.DEVNULL,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             text=True,
@@ -380,10 +380,12 @@ async def list_reports(
     reports = []
 
     if os.path.exists(REPORTS_DIR):
-        for folder in sorted(os.listdir(REPORTS_DIR), reverse=True):
-            folder_path = os.path.join(REPORTS_DIR, folder)
-            if not os.path.isdir(folder_path):
-                continue
+        # scandir gives the entry type without a stat() per report folder
+        with os.scandir(REPORTS_DIR) as it:
+            report_dirs = sorted((e for e in it if e.is_dir()), key=lambda e: e.name, reverse=True)
+        for entry in report_dirs:
+            folder = entry.name
+            folder_path = entry.path
 
             parsed = _parse_folder_name(folder)
 
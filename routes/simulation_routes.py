@@ -318,6 +318,7 @@ def start_simulation(body: SimulStartRequest) -> Dict[str, Any]:
     try:
         proc = subprocess.Popen(
             cmd,
+            stdin=subprocess.DEVNULL,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             text=True,
@@ -52,11 +52,11 @@ def _count_datasets() -> int:
 def _count_models() -> int:
     if not os.path.exists(TRAINED_MODELS_DIR):
         return 0
-    return sum(
-        1 for d in os.listdir(TRAINED_MODELS_DIR)
-        if os.path.isdir(os.path.join(TRAINED_MODELS_DIR, d))
-        and d.startswith("trained_model_")
-    )
+    with os.scandir(TRAINED_MODELS_DIR) as it:
+        return sum(
+            1 for e in it
+            if e.name.startswith("trained_model_") and e.is_dir()
+        )
 
 
 def _read_model_metrics() -> dict:
@@ -129,13 +129,13 @@ async def list_models():
     models = []
 
     if os.path.exists(TRAINED_MODELS_DIR):
-        for folder in os.listdir(TRAINED_MODELS_DIR):
-            folder_path = os.path.join(TRAINED_MODELS_DIR, folder)
-            if not os.path.isdir(folder_path) or not folder.startswith("trained_model_"):
-                continue
-            models.append({
-                "name": folder,
-                "type": "all" if "all" in folder else "default",
-            })
+        with os.scandir(TRAINED_MODELS_DIR) as it:
+            for entry in it:
+                if not entry.name.startswith("trained_model_") or not entry.is_dir():
+                    continue
+                models.append({
+                    "name": entry.name,
+                    "type": "all" if "all" in entry.name else "default",
+                })
 
     return {"models": models}
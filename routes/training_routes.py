@@ -84,6 +84,7 @@ def _run_training(job_id: str, request: TrainingStartRequest) -> None:
     try:
         proc = subprocess.Popen(
             cmd,
+            stdin=subprocess.DEVNULL,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             text=True,